@@ -14,6 +14,10 @@ Build one‑file exe:  pyinstaller --onefile --noconsole fieldlock.py
 """
 from __future__ import annotations
 
+import functools
+import hashlib
+import logging
+import hmac
 import json
 import sys
 import math
@@ -22,24 +26,28 @@ from typing import List
 
 from PySide6.QtCore import (
     Qt,
+    Signal,
+    QObject,
     QTimer,
     QSize,
     QEvent,
     QPoint,
-    QPropertyAnimation,
+    QRunnable,
+    QThreadPool,
     QPointF,
     QDateTime,
-    QEasingCurve,
 )
 from PySide6.QtGui import (
     QPixmap,
+    QImageReader,
     QGuiApplication,
     QCloseEvent,
     QKeyEvent,
-    QPainter,
-    QPainterPath,
+    QPalette,
+    QBrush,
     QIcon,
     QFont,
+    QFontMetrics,
 )
 from PySide6.QtWidgets import (
     QApplication,
@@ -49,14 +57,26 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
     QHBoxLayout,
     QDialog,
-    QFileDialog,
+    QButtonGroup,
     QGridLayout,
-    QMessageBox,
     QLineEdit,
-    QGraphicsOpacityEffect,
 )
 
+try:  # optional speed-up for config load/save — stdlib json is the fallback
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
 APP_NAME = "FieldLock"
+log = logging.getLogger(APP_NAME)
 EXEC_DIR = Path(sys.argv[0]).resolve().parent
 CONFIG_PATH = EXEC_DIR / "config.json"
 DEFAULT_PASS = "4123"
@@ -64,28 +84,167 @@ DEFAULT_WALL = EXEC_DIR / "wallpaper.png"  # optional neighbouring file
 UNLOCK_ICON = EXEC_DIR / "Unlock.png"
 SETTINGS_ICON = EXEC_DIR / "Settings.png"
 
+# one stylesheet, parsed once at startup — widgets opt in by objectName
+APP_QSS = """
+QPushButton#closeBtn {
+    background-color: rgba(255, 0, 0, 150);
+    color: white;
+    border: none;
+    border-radius: 15px;
+    font-size: 16px;
+    font-weight: bold;
+}
+QPushButton#closeBtn:hover {
+    background-color: rgba(255, 0, 0, 200);
+}
+QPushButton#roundBtn {
+    background-color: rgba(0, 0, 0, 150);
+    border: 2px solid rgba(255, 255, 255, 100);
+    border-radius: 40px;
+    outline: none;
+}
+QPushButton#roundBtn:hover {
+    background-color: rgba(50, 50, 50, 200);
+    border: 2px solid rgba(255, 255, 255, 200);
+}
+QPushButton#roundBtn:pressed {
+    background-color: rgba(100, 100, 100, 200);
+}
+QLabel#timeLbl {
+    color: white;
+    background-color: rgba(0, 0, 0, 100);
+    padding: 10px;
+    border-radius: 10px;
+}
+"""
+
 # global flag to allow all windows to close once passcode is verified
 UNLOCKED = False
 
+# key combos swallowed while locked (Alt+F4, Alt+Tab inside app, Esc)
+_BLOCKED_KEYS = frozenset((Qt.Key_Alt, Qt.Key_F4, Qt.Key_Tab, Qt.Key_Escape))
+
+
+class GlobalKeyBlocker(QObject):
+    """Single app-wide filter for the blocked key combos — one dispatch per
+    event instead of one per lock window."""
+
+    def eventFilter(self, obj, ev: QEvent):
+        if ev.type() == QEvent.KeyPress and ev.key() in _BLOCKED_KEYS:
+            # only swallow keys aimed at a lock window — the dialogs still
+            # need Tab to move focus and Esc to cancel
+            if isinstance(obj, QWidget) and isinstance(obj.window(), LockWindow):
+                return True  # block
+        return False
+
+
+class ClockBroadcaster(QObject):
+    """One shared 1-second timer feeding every lock window's clock label.
+
+    N monitors previously meant N timers, N string formats and N label
+    updates per second; now there is one of each, and the signal only
+    fires when the formatted time actually changed.
+    """
+
+    tick = Signal(str)
+
+    def __init__(self, parent: QObject | None = None):
+        super().__init__(parent)
+        self._last = ""
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self._on_timeout)
+
+    def start(self):
+        self._timer.start(1000)
+        self._on_timeout()
+
+    def _on_timeout(self):
+        # the keypad/settings dialog sits on top of the clock — skip the
+        # format and repaint while one is open; the next tick catches up
+        if QApplication.activeModalWidget() is not None:
+            return
+        s = QDateTime.currentDateTime().toString("hh:mm:ss")
+        if s != self._last:
+            self._last = s
+            self.tick.emit(s)
+
+
+WALL_CACHE_DIR = EXEC_DIR / ".cache"
+
+# wallpaper keys currently being decoded on the thread pool — windows show
+# their black background instead of decoding synchronously while one is set
+_WALL_PENDING: set[tuple[str, float]] = set()
+
+
+def _wall_cache_file(key: tuple[str, float], w: int, h: int) -> Path:
+    digest = hashlib.blake2b(f"{key[0]}|{key[1]}|{w}x{h}".encode()).hexdigest()[:16]
+    return WALL_CACHE_DIR / f"wall_{digest}.png"
+
+
+def load_cached_wall(key: tuple[str, float], w: int, h: int) -> QPixmap | None:
+    """Return the scaled wallpaper persisted by a previous run, if any."""
+    f = _wall_cache_file(key, w, h)
+    if f.exists():
+        pm = QPixmap(str(f))
+        if not pm.isNull():
+            return pm
+    return None
 
+
+def save_cached_wall(key: tuple[str, float], w: int, h: int, pm: QPixmap) -> None:
+    try:
+        WALL_CACHE_DIR.mkdir(exist_ok=True)
+        pm.save(str(_wall_cache_file(key, w, h)), "PNG")
+    except OSError:
+        pass  # cache is best-effort
+
+
+def decode_scaled(path: str, target: QSize) -> QPixmap:
+    """Decode an image directly at ~target size via QImageReader.
+
+    Lets libjpeg/libpng produce the downscaled image, so peak memory is
+    bounded by the screen resolution rather than the source resolution.
+    """
+    reader = QImageReader(path)
+    src = reader.size()
+    if src.isValid() and target.isValid():
+        reader.setScaledSize(src.scaled(target, Qt.KeepAspectRatioByExpanding))
+    img = reader.read()
+    return QPixmap.fromImage(img) if not img.isNull() else QPixmap()
+
+
+# unit gear outline (8 teeth, alternating outer/inner radius), computed once
+# at import — gear_icon only scales and translates it
+_GEAR_VERTS = tuple(
+    (
+        (0.45 if i % 2 == 0 else 0.32) * math.cos(math.pi * i / 8),
+        (0.45 if i % 2 == 0 else 0.32) * math.sin(math.pi * i / 8),
+    )
+    for i in range(16)
+)
+
+
+@functools.lru_cache(maxsize=8)
 def gear_icon(size: int = 64) -> QIcon:
-    """Generate a simple black gear icon."""
+    """Load the pre-baked gear icon, rasterising (and baking) it if absent."""
+    baked = EXEC_DIR / f"gear_{size}.png"
+    if baked.is_file():
+        pm = QPixmap(str(baked))
+        if not pm.isNull():
+            return QIcon(pm)
+
+    # painting machinery only matters when the baked PNG is missing
+    from PySide6.QtGui import QPainter, QPainterPath, QPolygonF
+
     pm = QPixmap(size, size)
     pm.fill(Qt.transparent)
     center = QPointF(size / 2, size / 2)
-    teeth = 8
-    outer = size * 0.45
-    inner = size * 0.32
+    poly = QPolygonF([
+        QPointF(center.x() + ux * size, center.y() + uy * size)
+        for ux, uy in _GEAR_VERTS
+    ])
     path = QPainterPath()
-    for i in range(teeth * 2):
-        ang = math.pi * i / teeth
-        r = outer if i % 2 == 0 else inner
-        x = center.x() + r * math.cos(ang)
-        y = center.y() + r * math.sin(ang)
-        if i == 0:
-            path.moveTo(x, y)
-        else:
-            path.lineTo(x, y)
+    path.addPolygon(poly)
     path.closeSubpath()
     painter = QPainter(pm)
     painter.setRenderHint(QPainter.Antialiasing)
@@ -93,12 +252,20 @@ def gear_icon(size: int = 64) -> QIcon:
     painter.setCompositionMode(QPainter.CompositionMode_Clear)
     painter.drawEllipse(center, size * 0.18, size * 0.18)
     painter.end()
+    try:
+        pm.save(str(baked), "PNG")  # bake for the next launch
+    except OSError:
+        pass
     return QIcon(pm)
 
 
 # --------------------------------------------------------------------
 #                             Config helper
 # --------------------------------------------------------------------
+# parsed config.json, keyed by (st_mtime_ns, st_size) of the file
+_CONFIG_CACHE: dict = {}
+
+
 class Config:
     """Tiny JSON wrapper with sane defaults."""
 
@@ -107,17 +274,39 @@ class Config:
         self.wallpaper_path: str = str(DEFAULT_WALL)
         self.keypad_len: int = 4
         self._load()
+        self._refresh_derived()
 
     # ----------------------------------------------------------------
     def _load(self):
         try:
             if CONFIG_PATH.exists():
-                data = json.loads(CONFIG_PATH.read_text(encoding="utf-8"))
+                st = CONFIG_PATH.stat()
+                key = (st.st_mtime_ns, st.st_size)
+                cached = _CONFIG_CACHE.get("data")
+                if cached is not None and cached[0] == key:
+                    data = cached[1]
+                else:
+                    data = _json_loads(CONFIG_PATH.read_bytes())
+                    _CONFIG_CACHE["data"] = (key, data)
                 self.passcode = str(data.get("passcode", self.passcode))
                 self.wallpaper_path = data.get("wallpaper_path", self.wallpaper_path)
                 self.keypad_len = int(data.get("keypad_length", self.keypad_len))
         except Exception as e:
-            print(f"Config load failed → defaults ({e})")
+            log.warning("Config load failed → defaults (%s)", e)
+
+    # ----------------------------------------------------------------
+    def _refresh_derived(self):
+        """Resolve the wallpaper path once so per-window code never has to
+        construct a Path or hit the filesystem, and pre-encode the passcode
+        for the keypad's bytes comparison."""
+        self.wallpaper_path_obj = Path(self.wallpaper_path)
+        try:
+            self.wallpaper_mtime = self.wallpaper_path_obj.stat().st_mtime
+            self.wallpaper_exists = True
+        except OSError:
+            self.wallpaper_mtime = 0.0
+            self.wallpaper_exists = False
+        self.passcode_bytes = self.passcode.encode()
 
     # ----------------------------------------------------------------
     def save(self):
@@ -126,7 +315,10 @@ class Config:
             "wallpaper_path": self.wallpaper_path,
             "keypad_length": self.keypad_len,
         }
-        CONFIG_PATH.write_text(json.dumps(data, indent=2), encoding="utf-8")
+        CONFIG_PATH.write_bytes(_json_dumps(data))
+        st = CONFIG_PATH.stat()
+        _CONFIG_CACHE["data"] = ((st.st_mtime_ns, st.st_size), data)
+        self._refresh_derived()
 
 
 # --------------------------------------------------------------------
@@ -150,19 +342,7 @@ class SettingsDialog(QDialog):
         close_btn = QPushButton("×")
         close_btn.setFixedSize(30, 30)
         close_btn.clicked.connect(self.reject)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(255, 0, 0, 150);
-                color: white;
-                border: none;
-                border-radius: 15px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 0, 0, 200);
-            }
-        """)
+        close_btn.setObjectName("closeBtn")
         title_row.addWidget(close_btn)
         lay.addLayout(title_row)
 
@@ -201,6 +381,8 @@ class SettingsDialog(QDialog):
 
     # ----------------------------------------------------------------
     def pick_wall(self):
+        from PySide6.QtWidgets import QFileDialog  # deferred — settings only
+
         path, _ = QFileDialog.getOpenFileName(self, "Select Wallpaper", str(EXEC_DIR), "Images (*.png *.jpg *.bmp)")
         if path:
             self.cfg.wallpaper_path = path
@@ -208,15 +390,21 @@ class SettingsDialog(QDialog):
 
     # ----------------------------------------------------------------
     def apply(self):
-        if any((self.new_edit.text(), self.new2_edit.text())):
-            if self.new_edit.text() != self.new2_edit.text():
-                QMessageBox.warning(self, APP_NAME, "New passcode mismatch.")
-                return
-            if not (4 <= len(self.new_edit.text()) <= 8 and self.new_edit.text().isdigit()):
+        from PySide6.QtWidgets import QMessageBox  # deferred — settings only
+
+        new = self.new_edit.text()
+        confirm = self.new2_edit.text()
+        if new or confirm:
+            # format first — compare_digest chokes on non-ASCII input, and
+            # both strings are user-typed so plain != leaks nothing anyway
+            if not (4 <= len(new) <= 8 and new.isascii() and new.isdigit()):
                 QMessageBox.warning(self, APP_NAME, "Passcode must be 4–8 digits.")
                 return
-            self.cfg.passcode = self.new_edit.text()
-            self.cfg.keypad_len = len(self.cfg.passcode)
+            if new != confirm:
+                QMessageBox.warning(self, APP_NAME, "New passcode mismatch.")
+                return
+            self.cfg.passcode = new
+            self.cfg.keypad_len = len(new)
         self.cfg.save()
         self.accept()
 
@@ -224,13 +412,35 @@ class SettingsDialog(QDialog):
 # --------------------------------------------------------------------
 #                            Keypad dialogue
 # --------------------------------------------------------------------
+# grid cell for each digit button, indexed by digit
+_KEYPAD_POSITIONS = (
+    (1, 0), (1, 1), (1, 2),
+    (2, 0), (2, 1), (2, 2),
+    (3, 0), (3, 1), (3, 2),
+    (4, 1),
+)
+
+
 class KeypadDialog(QDialog):
+    # static layout data — built once, not per dialog
+    _BTN_SIZE = QSize(80, 80)
+    # shake offsets, stepped through at a fixed 20 ms cadence
+    _SHAKE_OFFSETS = (10, -10, 6, -6, 3, -3, 0)
+
     def __init__(self, cfg: Config, parent: QWidget | None = None, *, prompt: str = "Enter passcode to unlock"):
         super().__init__(parent)
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.Dialog | Qt.WindowStaysOnTopHint)
         self.cfg = cfg
-        self.buffer = ""
+        # fixed-size input buffer — one allocation for the dialog lifetime,
+        # and scrubbable after a failed attempt
+        self.buffer = bytearray(cfg.keypad_len)
+        self.buf_len = 0
         self.prompt = prompt
+        # one timer for the dialog lifetime; shake() just restarts it
+        self._shake_idx = 0
+        self._shake_orig = QPoint()
+        self._shake_timer = QTimer(self, interval=20)
+        self._shake_timer.timeout.connect(self._shake_tick)
         self.build_ui()
         self.setModal(True)
 
@@ -242,75 +452,88 @@ class KeypadDialog(QDialog):
         close_btn = QPushButton("×")
         close_btn.setFixedSize(30, 30)
         close_btn.clicked.connect(self.reject)
-        close_btn.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(255, 0, 0, 150);
-                color: white;
-                border: none;
-                border-radius: 15px;
-                font-size: 16px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 0, 0, 200);
-            }
-        """)
+        close_btn.setObjectName("closeBtn")
         grid.addWidget(close_btn, 0, 2, alignment=Qt.AlignRight | Qt.AlignTop)
         
-        grid.addWidget(QLabel(self.prompt), 0, 0, 1, 2, alignment=Qt.AlignCenter)
+        self.prompt_lbl = QLabel(self.prompt)
+        grid.addWidget(self.prompt_lbl, 0, 0, 1, 2, alignment=Qt.AlignCenter)
         # digits
-        positions = [
-            (1, 0), (1, 1), (1, 2),
-            (2, 0), (2, 1), (2, 2),
-            (3, 0), (3, 1), (3, 2),
-            (4, 1),
-        ]
-        for num in range(10):
-            r, c = positions[num]
+        self._digits = QButtonGroup(self)
+        for num, (r, c) in enumerate(_KEYPAD_POSITIONS):
             btn = QPushButton(str(num))
-            btn.setFixedSize(QSize(80, 80))
-            btn.clicked.connect(lambda _, n=num: self.push(n))
+            btn.setFixedSize(self._BTN_SIZE)
+            self._digits.addButton(btn, num)
             grid.addWidget(btn, r, c)
+        self._digits.idClicked.connect(self.push)
         self.status_lbl = QLabel(" ")
         grid.addWidget(self.status_lbl, 5, 0, 1, 3, alignment=Qt.AlignCenter)
 
+    # ----------------------------------------------------------------
+    def set_prompt(self, text: str):
+        self.prompt_lbl.setText(text)
+
+    def reset(self):
+        """Prepare a cached dialog for reuse: clear input and status."""
+        if len(self.buffer) != self.cfg.keypad_len:
+            # passcode length changed in settings since construction
+            self.buffer = bytearray(self.cfg.keypad_len)
+            self.buf_len = 0
+        else:
+            self._clear_buffer()
+        self.status_lbl.setText(" ")
+
     # ----------------------------------------------------------------
     def push(self, digit: int):
-        if len(self.buffer) >= self.cfg.keypad_len:
+        if self.buf_len >= self.cfg.keypad_len:
             return
-        self.buffer += str(digit)
-        if len(self.buffer) == self.cfg.keypad_len:
+        self.buffer[self.buf_len] = 0x30 + digit  # ASCII '0'..'9'
+        self.buf_len += 1
+        if self.buf_len == self.cfg.keypad_len:
             self.check()
 
     # ----------------------------------------------------------------
     def keyPressEvent(self, e: QKeyEvent):
-        if e.text().isdigit():
-            self.push(int(e.text()))
-        elif e.key() == Qt.Key_Backspace:
-            self.buffer = self.buffer[:-1]
-        elif e.key() in (Qt.Key_Return, Qt.Key_Enter):
-            if len(self.buffer) == self.cfg.keypad_len:
+        k = e.key()
+        d = k - Qt.Key_0  # digit keys are contiguous — no text()/isdigit()
+        if 0 <= d <= 9:
+            self.push(d)
+        elif k == Qt.Key_Backspace:
+            if self.buf_len:
+                self.buf_len -= 1
+                self.buffer[self.buf_len] = 0
+        elif k in (Qt.Key_Return, Qt.Key_Enter):
+            if self.buf_len == self.cfg.keypad_len:
                 self.check()
         # ignore others
 
     # ----------------------------------------------------------------
     def check(self):
-        if self.buffer == self.cfg.passcode:
+        if hmac.compare_digest(bytes(self.buffer), self.cfg.passcode_bytes):
             self.accept()
         else:
             self.status_lbl.setText("Incorrect")
-            self.buffer = ""
+            self._clear_buffer()
             self.shake()
 
+    def _clear_buffer(self):
+        # zero, don't reassign — shortens the secret's lifetime in RAM
+        for i in range(len(self.buffer)):
+            self.buffer[i] = 0
+        self.buf_len = 0
+
     def shake(self):
-        orig = self.pos()
-        sequence = [10, -10, 6, -6, 3, -3, 0]
-        anim = QPropertyAnimation(self, b"pos")
-        anim.setDuration(len(sequence) * 20)
-        for i, off in enumerate(sequence):
-            anim.setKeyValueAt(i / (len(sequence) - 1), orig + QPoint(off, 0))
-        anim.start(QPropertyAnimation.DeleteWhenStopped)
-        self._anim = anim  # keep reference
+        # don't stack shakes on wrong-code spam — wait out the current one
+        if self._shake_timer.isActive():
+            return
+        self._shake_idx = 0
+        self._shake_orig = self.pos()
+        self._shake_timer.start()
+
+    def _shake_tick(self):
+        self.move(self._shake_orig + QPoint(self._SHAKE_OFFSETS[self._shake_idx], 0))
+        self._shake_idx += 1
+        if self._shake_idx >= len(self._SHAKE_OFFSETS):
+            self._shake_timer.stop()
 
 
 # --------------------------------------------------------------------
@@ -319,41 +542,62 @@ class KeypadDialog(QDialog):
 class LockWindow(QWidget):
     """One window per physical screen."""
 
-    def __init__(self, cfg: Config, screen, primary: bool):
+    # shared across instances: N monitors → one decode / one scale per size
+    _orig_cache: dict[tuple[str, float], QPixmap] = {}
+    _scaled_cache: dict[tuple[str, float, int, int], QPixmap] = {}
+
+    def __init__(self, cfg: Config, screen, primary: bool, clock: ClockBroadcaster):
         super().__init__()
         self.cfg = cfg
         self.primary = primary
+        self.clock = clock
         self.keypad_open = False
         self.setScreen(screen)
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnTopHint)
         self.setMouseTracking(True)
+        # debounce the expensive SmoothTransformation pass (see rescale)
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.setInterval(80)
+        self._smooth_timer.timeout.connect(self._smooth_rescale)
+        # coalesce raise_() requests so N windows don't ping-pong focus
+        self._raise_timer = QTimer(self)
+        self._raise_timer.setSingleShot(True)
+        self._raise_timer.setInterval(50)
+        self._raise_timer.timeout.connect(self._maybe_raise)
         self.build_ui()
         self.load_wall()
+        # one keypad per window, reused for every unlock/settings attempt
+        self._keypad = KeypadDialog(cfg, self)
+        self._keypad.adjustSize()
+        # geometry bits for centring the keypad, cached off the hot path
+        self._keypad_offset = self._keypad.rect().center()
+        self._center = self.geometry().center()
+
+    # shown by main() once every window exists, so Qt resolves the screen
+    # topology before anything becomes visible
+    def show_now(self):
         self.showFullScreen()
-        self.installEventFilter(self)  # intercept Alt+F4 etc.
 
     # ----------------------------------------------------------------
     def build_ui(self):
-        self.setStyleSheet("background-color: black;")
-        
-        # 壁紙ラベルを全画面に設定
-        self.wall_lbl = QLabel(self)
-        self.wall_lbl.setAlignment(Qt.AlignCenter)
-        self.wall_lbl.setStyleSheet("background-color: black;")
-        self.wall_lbl.setMouseTracking(True)
-        self.wall_lbl.installEventFilter(self)
-        
+        # wallpaper painted as the window background brush — one native
+        # fill per repaint instead of a separate QLabel layer
+        pal = self.palette()
+        pal.setColor(QPalette.Window, Qt.black)
+        self.setPalette(pal)
+        self.setAutoFillBackground(True)
+
         # 現在時刻ラベル（左下）- 常に表示
         self.time_lbl = QLabel(self)
-        self.time_lbl.setStyleSheet("""
-            color: white;
-            font-size: 64px;
-            font-weight: bold;
-            background-color: rgba(0, 0, 0, 100);
-            padding: 10px;
-            border-radius: 10px;
-        """)
+        self.time_lbl.setObjectName("timeLbl")
         # 時刻は常に表示
+        # monospace digits keep the width constant, so the geometry can be
+        # fixed up front instead of adjustSize() running every second
+        self.time_lbl.setFont(QFont("Consolas", 48, QFont.Bold))
+        fm = QFontMetrics(self.time_lbl.font())
+        self.time_lbl.setFixedSize(fm.horizontalAdvance("00:00:00") + 40, fm.height() + 20)
+        self.time_lbl.setAlignment(Qt.AlignCenter)
         
         # アンロックボタン（画面中央下部）
         self.unlock_btn = QPushButton(self)
@@ -365,21 +609,7 @@ class LockWindow(QWidget):
         self.unlock_btn.setFixedSize(80, 80)
         self.unlock_btn.clicked.connect(self.request_unlock)
         # hide()を削除 - 代わりにopacityで制御
-        self.unlock_btn.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(0, 0, 0, 150);
-                border: 2px solid rgba(255, 255, 255, 100);
-                border-radius: 40px;
-                outline: none;
-            }
-            QPushButton:hover {
-                background-color: rgba(50, 50, 50, 200);
-                border: 2px solid rgba(255, 255, 255, 200);
-            }
-            QPushButton:pressed {
-                background-color: rgba(100, 100, 100, 200);
-            }
-        """)
+        self.unlock_btn.setObjectName("roundBtn")
         
         # 設定ボタン（画面中央下部）
         self.settings_btn = QPushButton(self)
@@ -391,122 +621,131 @@ class LockWindow(QWidget):
         self.settings_btn.setFixedSize(80, 80)
         self.settings_btn.clicked.connect(self.settings)
         # hide()を削除 - 代わりにopacityで制御
-        self.settings_btn.setStyleSheet("""
-            QPushButton {
-                background-color: rgba(0, 0, 0, 150);
-                border: 2px solid rgba(255, 255, 255, 100);
-                border-radius: 40px;
-                outline: none;
-            }
-            QPushButton:hover {
-                background-color: rgba(50, 50, 50, 200);
-                border: 2px solid rgba(255, 255, 255, 200);
-            }
-            QPushButton:pressed {
-                background-color: rgba(100, 100, 100, 200);
-            }
-        """)
-        
-        # ボタンにOpacityエフェクトを追加
-        self.unlock_effect = QGraphicsOpacityEffect()
-        self.unlock_btn.setGraphicsEffect(self.unlock_effect)
-        self.unlock_effect.setOpacity(0.0)  # 初期状態は透明
-        
-        self.settings_effect = QGraphicsOpacityEffect()
-        self.settings_btn.setGraphicsEffect(self.settings_effect)
-        self.settings_effect.setOpacity(0.0)  # 初期状態は透明
-        
-        # フェードアニメーション
-        self.unlock_anim = QPropertyAnimation(self.unlock_effect, b"opacity")
-        self.unlock_anim.setDuration(500)  # 0.5秒
-        self.unlock_anim.setEasingCurve(QEasingCurve.InOutQuad)
-        
-        self.settings_anim = QPropertyAnimation(self.settings_effect, b"opacity")
-        self.settings_anim.setDuration(500)  # 0.5秒
-        self.settings_anim.setEasingCurve(QEasingCurve.InOutQuad)
+        self.settings_btn.setObjectName("roundBtn")
         
         # UIを隠すタイマー（10秒）
         self.hide_timer = QTimer(self)
         self.hide_timer.setSingleShot(True)
-        self.hide_timer.timeout.connect(self.fade_out_ui)
-        
-        # 時刻更新タイマー（1秒ごと）
-        self.time_timer = QTimer(self)
-        self.time_timer.timeout.connect(self.update_time)
-        self.time_timer.start(1000)
-        self.update_time()
+        self.hide_timer.timeout.connect(self.hide_ui)
         
+        # 時刻表示はアプリ共有のタイマーから更新される
+        self.clock.tick.connect(self._on_clock_tick)
+
         # UI状態の管理
         self.ui_visible = False
-        
-        # ボタンを表示状態にする（透明度で見えないが、クリック可能にする）
-        self.unlock_btn.show()
-        self.settings_btn.show()
+        self.unlock_btn.hide()
+        self.settings_btn.hide()
 
     # ----------------------------------------------------------------
     def load_wall(self):
-        path = Path(self.cfg.wallpaper_path)
-        pm = QPixmap(str(path)) if path.exists() else QPixmap()
-        if pm.isNull():
-            pm = QPixmap(1, 1)
-            pm.fill(Qt.black)
-        self._orig_wall = pm
+        if self.cfg.wallpaper_exists:
+            self._wall_key = (str(self.cfg.wallpaper_path_obj), self.cfg.wallpaper_mtime)
+        else:
+            self._wall_key = None
+        self._orig_wall = None  # decoded lazily — cache hits never need it
+        self._last_scaled = None  # size of the last applied scale
         self.rescale()
 
+    def _get_orig(self) -> QPixmap:
+        if self._orig_wall is None:
+            pm = None
+            if self._wall_key is not None:
+                pm = self._orig_cache.get(self._wall_key)
+                if pm is None:
+                    pm = decode_scaled(self._wall_key[0], self.screen().geometry().size())
+                    self._orig_cache[self._wall_key] = pm
+            if pm is None or pm.isNull():
+                pm = QPixmap(1, 1)
+                pm.fill(Qt.black)
+            self._orig_wall = pm
+        return self._orig_wall
+
     def rescale(self):
-        if not hasattr(self, '_orig_wall') or self._orig_wall.isNull():
+        """Paint a fast scale now; the smooth pass follows once the size settles."""
+        if not hasattr(self, '_wall_key'):
             return
         size = self.size()
-        scaled = self._orig_wall.scaled(
+        # before the first show the widget sits at Qt's default size —
+        # scaling for it would just decode on the GUI thread and be thrown
+        # away by the fullscreen resize a tick later
+        if not self.isVisible() and size != self.screen().geometry().size():
+            return
+        # Qt emits spurious resizes during the show sequence — skip no-ops
+        if size == self._last_scaled:
+            return
+        self._last_scaled = size
+        if self._wall_key is not None:
+            skey = self._wall_key + (size.width(), size.height())
+            scaled = self._scaled_cache.get(skey)
+            if scaled is None:
+                scaled = load_cached_wall(self._wall_key, size.width(), size.height())
+                if scaled is not None:
+                    self._scaled_cache[skey] = scaled
+            if scaled is not None:
+                self._smooth_timer.stop()  # cached pixmap is already smooth
+                self._apply_wall(scaled)
+                return
+            if self._wall_key in _WALL_PENDING:
+                self._last_scaled = None  # re-run once the loader lands
+                return
+        self._apply_wall(self._get_orig().scaled(
+            size, Qt.KeepAspectRatioByExpanding, Qt.FastTransformation
+        ))
+        self._smooth_timer.start()
+
+    def _smooth_rescale(self):
+        if not hasattr(self, '_wall_key'):
+            return
+        size = self.size()
+        if self._wall_key is not None:
+            # a cache hit for this size already applied the smooth version —
+            # don't resample and rewrite the disk PNG for nothing
+            if self._wall_key + (size.width(), size.height()) in self._scaled_cache:
+                return
+        scaled = self._get_orig().scaled(
             size, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation
         )
-        self.wall_lbl.setPixmap(scaled)
-
-    def update_time(self):
-        """現在時刻を更新"""
-        current_time = QDateTime.currentDateTime().toString("hh:mm:ss")
-        self.time_lbl.setText(current_time)
-        self.time_lbl.adjustSize()  # テキストに合わせてサイズを調整
+        if self._wall_key is not None:
+            self._scaled_cache[self._wall_key + (size.width(), size.height())] = scaled
+            save_cached_wall(self._wall_key, size.width(), size.height(), scaled)
+        self._apply_wall(scaled)
+
+    def _apply_wall(self, pm: QPixmap):
+        # centre-crop to the window so the brush doesn't anchor top-left
+        w, h = self.width(), self.height()
+        if pm.width() > w or pm.height() > h:
+            pm = pm.copy((pm.width() - w) // 2, (pm.height() - h) // 2, w, h)
+        pal = self.palette()
+        pal.setBrush(QPalette.Window, QBrush(pm))
+        self.setPalette(pal)
+
+    def _on_clock_tick(self, text: str):
+        self.time_lbl.setText(text)
 
     def show_ui(self):
-        """UIコントロールをフェードインで表示"""
+        """UIコントロールを表示"""
         if not self.ui_visible:
             self.ui_visible = True
-            # ボタンを確実に表示状態にする
             self.unlock_btn.show()
             self.settings_btn.show()
-            
-            # フェードイン
-            self.unlock_anim.setStartValue(0.0)
-            self.unlock_anim.setEndValue(1.0)
-            self.unlock_anim.start()
-            
-            self.settings_anim.setStartValue(0.0)
-            self.settings_anim.setEndValue(1.0)
-            self.settings_anim.start()
-        
-        # タイマーリセット
-        self.hide_timer.start(10000)  # 10秒後に隠す
-
-    def fade_out_ui(self):
-        """UIコントロールをフェードアウトで隠す"""
+            self.hide_timer.start(10000)  # 10秒後に隠す
+        elif self.hide_timer.remainingTime() < 9500:
+            # mouse moves call this per pixel — only touch the timer once the
+            # deadline has actually drifted
+            self.hide_timer.start(10000)
+
+    def hide_ui(self):
+        """UIコントロールを隠す"""
         if self.ui_visible:
             self.ui_visible = False
-            # フェードアウト
-            self.unlock_anim.setStartValue(1.0)
-            self.unlock_anim.setEndValue(0.0)
-            self.unlock_anim.start()
-            
-            self.settings_anim.setStartValue(1.0)
-            self.settings_anim.setEndValue(0.0)
-            self.settings_anim.start()
+            self.unlock_btn.hide()
+            self.settings_btn.hide()
 
     # ----------------------------------------------------------------
     def resizeEvent(self, _):
+        self._center = self.geometry().center()
         self.rescale()
-        # 壁紙ラベルを全画面に設定
-        self.wall_lbl.setGeometry(self.rect())
-        
+
         # 時刻ラベルを左下に配置
         self.time_lbl.move(20, self.height() - self.time_lbl.height() - 20)
         
@@ -522,21 +761,23 @@ class LockWindow(QWidget):
 
     # keep top‑most
     def focusOutEvent(self, _):
-        QTimer.singleShot(50, self.raise_)
+        if not self._raise_timer.isActive():
+            self._raise_timer.start()
+
+    def _maybe_raise(self):
+        # focus moved to a sibling lock window or our keypad — no need to
+        # fight it and trigger another repaint cascade
+        w = QApplication.focusWidget()
+        if w is not None and isinstance(w.window(), (LockWindow, KeypadDialog)):
+            return
+        self.raise_()
 
     # UIを表示
     def mousePressEvent(self, event):
         self.show_ui()
-        # ボタンがクリックされた場合の処理（透明度に関係なく）
-        if self.unlock_btn.geometry().contains(event.pos()):
-            # アンロックボタンがクリックされた
-            self.request_unlock()
-        elif self.settings_btn.geometry().contains(event.pos()):
-            # 設定ボタンがクリックされた
-            self.settings()
-        else:
-            # 画面の何もないところをクリックした場合
-            self.request_unlock()
+        # 表示中のボタンはクリックを直接受けるので、ここに届いたクリックは
+        # 画面の何もないところ → キーパッドを開く
+        self.request_unlock()
 
     def mouseMoveEvent(self, _):
         self.show_ui()
@@ -550,28 +791,16 @@ class LockWindow(QWidget):
         if not UNLOCKED:
             e.ignore()
 
-    # swallow key combos inside window
-    def eventFilter(self, obj, ev: QEvent):
-        if obj is self.wall_lbl:
-            if ev.type() == QEvent.MouseMove:
-                self.show_ui()
-            elif ev.type() == QEvent.MouseButtonPress:
-                self.show_ui()
-        if ev.type() == QEvent.KeyPress and isinstance(ev, QKeyEvent):
-            key = ev.key()
-            if key in (Qt.Key_Alt, Qt.Key_F4, Qt.Key_Tab, Qt.Key_Escape):
-                return True  # block
-        return super().eventFilter(obj, ev)
-
     # ----------------------------------------------------------------
     def unlock(self):
         if self.keypad_open:
             return
         self.keypad_open = True
-        dlg = KeypadDialog(self.cfg, self)
-        dlg.adjustSize()
+        dlg = self._keypad
+        dlg.set_prompt("Enter passcode to unlock")
+        dlg.reset()
         # center on this window
-        dlg.move(self.geometry().center() - dlg.rect().center())
+        dlg.move(self._center - self._keypad_offset)
         if dlg.exec() == QDialog.Accepted:
             global UNLOCKED
             UNLOCKED = True
@@ -587,29 +816,141 @@ class LockWindow(QWidget):
         if self.keypad_open:
             return
         self.keypad_open = True
-        kp = KeypadDialog(self.cfg, self, prompt="Enter passcode to change settings")
-        kp.adjustSize()
-        kp.move(self.geometry().center() - kp.rect().center())
+        kp = self._keypad
+        kp.set_prompt("Enter passcode to change settings")
+        kp.reset()
+        kp.move(self._center - self._keypad_offset)
         if kp.exec() == QDialog.Accepted:
             dlg = SettingsDialog(self.cfg, self)
             if dlg.exec() == QDialog.Accepted:
-                self.load_wall()
+                # wallpaper may have changed — drop stale cache entries and
+                # reload every monitor, not just the one settings ran on
+                LockWindow._orig_cache.clear()
+                LockWindow._scaled_cache.clear()
+                # re-scale the new wallpaper once per screen size off-thread
+                # (and persist it), rather than per window on the GUI thread
+                warmup = getattr(QApplication.instance(), "_warmup", None)
+                if warmup is not None:
+                    warmup.start(self.cfg)
+                for w in QApplication.topLevelWidgets():
+                    if isinstance(w, LockWindow):
+                        w.load_wall()
         self.keypad_open = False
 
 
 # --------------------------------------------------------------------
 #                                 main
 # --------------------------------------------------------------------
+class WallpaperLoader(QRunnable):
+    """Decode and smooth-scale the wallpaper off the GUI thread.
+
+    QPixmap is GUI-thread-only, so the worker deals in QImage; the receiver
+    converts the results once they arrive back on the GUI thread.
+    """
+
+    class _Signals(QObject):
+        done = Signal(object, object)  # (path, mtime) key, dict[(w, h), QImage]
+
+    def __init__(self, key: tuple[str, float], sizes: list[QSize]):
+        super().__init__()
+        self.key = key
+        self.sizes = sizes
+        self.signals = self._Signals()
+
+    def run(self):
+        reader = QImageReader(self.key[0])
+        reader.setAutoTransform(True)
+        src = reader.size()
+        largest = max(self.sizes, key=lambda s: s.width() * s.height())
+        if src.isValid():
+            reader.setScaledSize(src.scaled(largest, Qt.KeepAspectRatioByExpanding))
+        img = reader.read()
+        out = {}
+        if not img.isNull():
+            for sz in self.sizes:
+                out[(sz.width(), sz.height())] = img.scaled(
+                    sz, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation
+                )
+        self.signals.done.emit(self.key, out)
+
+
+class WallpaperWarmup(QObject):
+    """Seed the LockWindow caches with one smooth scale per unique screen
+    geometry. Disk-cache hits are applied synchronously (cheap PNG loads);
+    anything missing is decoded and scaled on the global thread pool so the
+    lock screens appear immediately and the wallpaper follows."""
+
+    def __init__(self, parent: QObject | None = None):
+        super().__init__(parent)
+        self._want_key = None  # latest requested wallpaper — stale results are dropped
+        self._loaders: dict = {}  # key → in-flight loader, keeps signal holders alive
+
+    def start(self, cfg: Config) -> None:
+        if not cfg.wallpaper_exists:
+            return
+        key = (str(cfg.wallpaper_path_obj), cfg.wallpaper_mtime)
+        self._want_key = key
+        if key in _WALL_PENDING:
+            return  # this wallpaper is already being loaded
+        sizes = []
+        for sc in QGuiApplication.screens():
+            sz = sc.geometry().size()
+            if sz not in sizes:
+                sizes.append(sz)
+
+        # previous runs persist their smooth scales — a full hit skips the decode
+        missing = []
+        for sz in sizes:
+            cached = load_cached_wall(key, sz.width(), sz.height())
+            if cached is not None:
+                LockWindow._scaled_cache[key + (sz.width(), sz.height())] = cached
+            else:
+                missing.append(sz)
+        if not missing:
+            return
+
+        _WALL_PENDING.add(key)
+        loader = WallpaperLoader(key, missing)
+        # queued — this object lives in the GUI thread, so _apply does too
+        loader.signals.done.connect(self._apply, Qt.QueuedConnection)
+        self._loaders[key] = loader
+        QThreadPool.globalInstance().start(loader)
+
+    def _apply(self, key: tuple, images: dict) -> None:
+        _WALL_PENDING.discard(key)
+        self._loaders.pop(key, None)
+        if key != self._want_key:
+            return  # the wallpaper changed while this decode was in flight
+        for (w, h), img in images.items():
+            pm = QPixmap.fromImage(img)
+            LockWindow._scaled_cache[key + (w, h)] = pm
+            save_cached_wall(key, w, h, pm)
+        for win in QApplication.topLevelWidgets():
+            if isinstance(win, LockWindow):
+                win.load_wall()
+
+
 def main() -> None:
+    logging.basicConfig(level=logging.INFO)
     app = QApplication(sys.argv)
     app.setApplicationName(APP_NAME)
+    app.setStyleSheet(APP_QSS)
+    blocker = GlobalKeyBlocker()
+    app.installEventFilter(blocker)
+    app._blocker = blocker  # keep alive for the app lifetime
     cfg = Config()
 
+    warmup = WallpaperWarmup(app)
+    app._warmup = warmup  # reused after Settings saves a new wallpaper
+    warmup.start(cfg)
+    clock = ClockBroadcaster(app)
     primary = QGuiApplication.primaryScreen()
     windows: List[LockWindow] = []
     for sc in QGuiApplication.screens():
-        win = LockWindow(cfg, sc, sc == primary)
+        win = LockWindow(cfg, sc, sc == primary, clock)
         windows.append(win)
+    clock.start()
+    QTimer.singleShot(0, lambda: [w.show_now() for w in windows])
     sys.exit(app.exec())
 
 
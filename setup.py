@@ -1,4 +1,5 @@
 from cx_Freeze import setup, Executable
+import os
 import sys
 
 # GUI application option
@@ -15,6 +16,11 @@ include_files = [
     "fieldlock.ico"
 ]
 
+# Baked fallback gear icon (written by a prior run of fieldlock.py);
+# ship it so the frozen exe never has to rasterise the gear itself.
+if os.path.exists("gear_64.png"):
+    include_files.append("gear_64.png")
+
 # Setup
 setup(
     name="FieldLock",